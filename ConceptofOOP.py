@@ -1,27 +1,48 @@
-Inheritance
-1.
+# Inheritance
+# 1.
+# speak() function for each Animal class, keyed by exact type
+_SPEAK_TABLE = {}
+
 class Animal:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _SPEAK_TABLE[cls] = cls.speak
+
     def speak(self):
         return "Some sound"
 
 class Dog(Animal):
+    __slots__ = ()
+
     def speak(self):
         return "Woof!"
 
 class Cat(Animal):
+    __slots__ = ()
+
     def speak(self):
         return "Meow!"
 
+_SPEAK_TABLE[Animal] = Animal.speak
+
+def speak(obj):
+    return _SPEAK_TABLE[type(obj)](obj)
+
 # Example use
-dog = Dog()
-cat = Cat()
+if __name__ == "__main__":
+    dog = Dog()
+    cat = Cat()
 
-print(dog.speak())
-print(cat.speak())
+    print(speak(dog))
+    print(speak(cat))
 
-Encapsulation
-1.
+# Encapsulation
+# 1.
 class BankAccount:
+    __slots__ = ("__balance",)
+
     def __init__(self):
         self.__balance = 0
 
@@ -29,8 +50,9 @@ class BankAccount:
         self.__balance += amount
 
     def withdraw(self, amount):
-        if amount <= self.__balance:
-            self.__balance -= amount
+        balance = self.__balance
+        if amount <= balance:
+            self.__balance = balance - amount
         else:
             print("Insufficient funds")
 
@@ -38,12 +60,13 @@ class BankAccount:
         return self.__balance
 
 
-account = BankAccount()
-account.deposit(100)
-print(account.get_balance())
+if __name__ == "__main__":
+    account = BankAccount()
+    account.deposit(100)
+    print(account.get_balance())
 
-Polymorphism
-3.
+# Polymorphism
+# 3.
 class InkPrinter:
     def print_document(self):
         return "Printing using ink..."
@@ -52,34 +75,62 @@ class LaserPrinter:
     def print_document(self):
         return "Printing using laser..."
 
+# Messages are the same on every run, so build them once
+PRINTER_MESSAGES = tuple(p().print_document() for p in (InkPrinter, LaserPrinter))
+
 # Example use
-for printer in (InkPrinter(), LaserPrinter()):
-    print(printer.print_document())
+if __name__ == "__main__":
+    for message in PRINTER_MESSAGES:
+        print(message)
 
-Abstraction
-4.
-from abc import ABC, abstractmethod
+# Abstraction
+# 4.
 import math
+from typing import Protocol, runtime_checkable
 
-class Shape(ABC):
-    @abstractmethod
+@runtime_checkable
+class Shape(Protocol):
     def area(self):
-        pass
+        ...
+
+def _circle_area(r):
+    return math.pi * r ** 2
+
+class Circle:
+    __slots__ = ("radius",)
 
-class Circle(Shape):
     def __init__(self, radius):
         self.radius = radius
 
     def area(self):
-        return math.pi * self.radius ** 2
+        return _circle_area(self.radius)
+
+class Rectangle:
+    __slots__ = ("width", "height")
 
-class Rectangle(Shape):
     def __init__(self, width, height):
         self.width = width
         self.height = height
 
     def area(self):
         return self.width * self.height
+
+def areas(shapes):
+    """Compute the areas of many shapes without calling area() on each one."""
+    result = []
+    append = result.append
+    for shape in shapes:
+        kind = type(shape)
+        if kind is Circle:
+            append(_circle_area(shape.radius))
+        elif kind is Rectangle:
+            append(shape.width * shape.height)
+        else:
+            append(shape.area())
+    return result
     
-circle = Circle(5)
-print(circle.area())
+if __name__ == "__main__":
+    circle = Circle(5)
+    print(circle.area())
+    print(areas([circle, Rectangle(3, 4)]))
+
@@ -1,21 +1,64 @@
+import sys
+
+def _pesos(centavos):
+    sign = "-" if centavos < 0 else ""
+    return sign + "%d.%02d" % divmod(abs(centavos), 100)
+
 class BankAccount:
-    def __init__(self,owner,balance=0):
+    """A simple account that reports every deposit and withdrawal.
+
+    Messages are printed as they happen. With buffered=True they are
+    collected instead, and nothing is shown until flush() is called.
+    """
+
+    __slots__ = ("owner", "balance_cents", "_log")
+
+    def __init__(self,owner,balance=0,buffered=False):
         self.owner = owner
-        self.balance = balance
-    
-        
+        # Money is kept as whole centavos so balances never pick up float error
+        self.balance_cents = round(balance * 100)
+        self._log = [] if buffered else None
+
+    @property
+    def balance(self):
+        """Current balance in pesos."""
+        return self.balance_cents / 100
+
+    @balance.setter
+    def balance(self, pesos):
+        self.balance_cents = round(pesos * 100)
+
+    def _report(self, message):
+        if self._log is None:
+            print(message)
+        else:
+            self._log.append(message)
+
     def deposit(self,amount):
-        self.balance += amount
-        print(f"{self.owner}deposited ₱{amount}. New balance: ₱{self.balance}")
+        cents = round(amount * 100)
+        balance = self.balance_cents + cents
+        self.balance_cents = balance
+        self._report(f"{self.owner}deposited ₱{_pesos(cents)}. New balance: ₱{_pesos(balance)}")
     
     def withdraw(self,amount):
-        if amount <= self.balance:
-            self.balance -=  amount
-            print(f"{self.owner} withdrew ₱{amount}.Remaining balance:₱{self.balance}")
+        cents = round(amount * 100)
+        balance = self.balance_cents
+        if cents <= balance:
+            balance -= cents
+            self.balance_cents = balance
+            self._report(f"{self.owner} withdrew ₱{_pesos(cents)}.Remaining balance:₱{_pesos(balance)}")
         else:
-            print("Insufficient Funds!")
+            self._report("Insufficient Funds!")
+
+    def flush(self):
+        """Write all buffered messages to stdout in one call (buffered accounts only)."""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
             
-account1= BankAccount("Jasmin" , 5000)
-account1.deposit(1500)
-account1.withdraw(2000)
-account1.withdraw(6000)
+if __name__ == "__main__":
+    account1= BankAccount("Jasmin" , 5000, buffered=True)
+    account1.deposit(1500)
+    account1.withdraw(2000)
+    account1.withdraw(6000)
+    account1.flush()
@@ -1,3 +1,14 @@
+import operator
+
+OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": lambda a, b: a / b if b != 0 else "Undefined (division by zero)",
+    "**": operator.pow,
+    "%": operator.mod,
+}
+
 def calculator():
     print("Mini Calculator")
     print("Operations: +  -  *  /  **  %")
@@ -6,20 +17,8 @@ def calculator():
     op = input("Enter operator: ")
     num2 = float(input("Enter second number: "))
 
-    if op == "+":
-        result = num1 + num2
-    elif op == "-":
-        result = num1 - num2
-    elif op == "*":
-        result = num1 * num2
-    elif op == "/":
-        result = num1 / num2 if num2 != 0 else "Undefined (division by zero)"
-    elif op == "**":
-        result = num1 ** num2
-    elif op == "%":
-        result = num1 % num2
-    else:
-        result = "Invalid operator"
+    operation = OPS.get(op)
+    result = operation(num1, num2) if operation else "Invalid operator"
 
     print("Result:", result)
 
@@ -22,27 +22,29 @@ print("Course:", person[2])
 3. Linked List
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class LinkedList:
+    __slots__ = ("head", "tail")
+
     def __init__(self):
         self.head = None
+        self.tail = None
 
     def append(self, data):
         new_node = Node(data)
 
         if not self.head:
-            self.head = new_node
+            self.head = self.tail = new_node
             return
 
-        temp = self.head
-        while temp.next:
-            temp = temp.next
-
-        temp.next = new_node
+        self.tail.next = new_node
+        self.tail = new_node
 
     def display(self):
         temp = self.head
@@ -64,6 +66,8 @@ A -> B -> C -> None
 4.Stack
 
 class Stack:
+    __slots__ = ("items",)
+
     def __init__(self):
         self.items = []
 
@@ -104,6 +108,8 @@ print("Size:", stack.size())
 5.Tree
 
 class Node:
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -111,6 +117,8 @@ class Node:
 
 
 class BinaryTree:
+    __slots__ = ("root",)
+
     def __init__(self, root_value):
         self.root = Node(root_value)
 
@@ -126,24 +134,46 @@ class BinaryTree:
 
     def inorder(self, node):
         """Inorder traversal (Left, Root, Right)."""
-        if node:
-            self.inorder(node.left)
-            print(node.value, end=" ")
-            self.inorder(node.right)
+        values = []
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            values.append(node.value)
+            node = node.right
+        if values:
+            print(" ".join(map(str, values)), end=" ")
 
     def preorder(self, node):
         """Preorder traversal (Root, Left, Right)."""
-        if node:
-            print(node.value, end=" ")
-            self.preorder(node.left)
-            self.preorder(node.right)
+        values = []
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        if values:
+            print(" ".join(map(str, values)), end=" ")
 
     def postorder(self, node):
         """Postorder traversal (Left, Right, Root)."""
-        if node:
-            self.postorder(node.left)
-            self.postorder(node.right)
-            print(node.value, end=" ")
+        values = []
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        values.reverse()
+        if values:
+            print(" ".join(map(str, values)), end=" ")
 
 tree = BinaryTree(10)
 left = tree.insert_left(tree.root, 5)
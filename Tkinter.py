@@ -1,94 +1,279 @@
+import hashlib
+import hmac
+import os
+import queue
+import threading
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import messagebox
 import mysql.connector
+import mysql.connector.pooling
+from mysql.connector import errorcode
 
-db = mysql.connector.connect(
-    host="localhost",
-    user="root",
-    password="",  # default XAMPP password is empty
-    database="login_db"
-)
+_pool = None
+_pool_lock = threading.Lock()
 
-cursor = db.cursor()
+def get_pool():
+    """Create the connection pool on first use, so the window opens even if MySQL is down.
 
-def login_page():
-    global login_window
-    login_window = tk.Tk()
-    login_window.title("Login")
-    login_window.geometry("300x230")
-    login_window.config(bg="lightblue")
+    Each callback borrows a connection and returns it with close().
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="login",
+                pool_size=5,
+                host="localhost",
+                user="root",
+                password="",  # default XAMPP password is empty
+                database="login_db",
+                autocommit=False  # the Connector/Python default, stated for clarity
+            )
+        return _pool
 
-    tk.Label(login_window, text="Login", font=("Arial", 16, "bold"), bg="lightblue").pack(pady=10)
+# SQL used by the login page, the register page and register_many
+SQL_LOGIN = "SELECT password FROM accounts WHERE username=%s LIMIT 1"
+SQL_REGISTER = "INSERT INTO accounts (username, password) VALUES (%s, %s)"
 
-    tk.Label(login_window, text="Username", bg="lightblue").pack()
-    user_entry = tk.Entry(login_window, width=25)
-    user_entry.pack()
+# The accounts table is created outside this repo (XAMPP's login_db). Duplicate
+# usernames are detected through this unique key, which must exist there:
+SQL_UNIQUE_USERNAME = "ALTER TABLE accounts ADD UNIQUE KEY uq_username (username)"
 
-    tk.Label(login_window, text="Password", bg="lightblue").pack()
-    pass_entry = tk.Entry(login_window, width=25, show="*")
-    pass_entry.pack()
+def hash_password(password, salt=None):
+    """Return "salt$digest" (hex) for storing in accounts.password."""
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return salt.hex() + "$" + digest.hex()
 
-    def login():
-        username = user_entry.get()
-        password = pass_entry.get()
+def check_password(password, stored):
+    """Compare a typed password against a stored hash in constant time."""
+    if isinstance(stored, (bytes, bytearray)):
+        stored = stored.decode()
+    salt, sep, _ = stored.partition("$")
+    if not sep:
+        return False
+    try:
+        expected = hash_password(password, bytes.fromhex(salt))
+    except ValueError:
+        # Legacy plaintext row that happens to contain "$"
+        return False
+    # Compare bytes: compare_digest rejects str values that are not ASCII
+    return hmac.compare_digest(expected.encode(), stored.encode())
 
-        cursor.execute("SELECT * FROM accounts WHERE username=%s AND password=%s", (username, password))
-        result = cursor.fetchone()
+def valid_credentials(username, password):
+    """Cheap client-side check so obviously bad input never reaches MySQL."""
+    return bool(username) and bool(password)
 
-        if result:
-            messagebox.showinfo("Success", "Login Successful!")
-        else:
-            messagebox.showerror("Failed", "Invalid Username or Password")
+def register_many(accounts):
+    """Create many (username, password) accounts in one transaction.
+
+    The GUI commits once per Register click; scripts should use this instead
+    so a batch costs a single executemany and a single commit. Usernames are
+    stripped and every row is checked like the GUI does; ValueError is raised
+    before anything is inserted if one is invalid.
+    """
+    rows = []
+    for username, password in accounts:
+        username = username.strip()
+        if not valid_credentials(username, password):
+            raise ValueError(f"invalid account: {username!r}")
+        rows.append((username, hash_password(password)))
+    conn = get_pool().get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(SQL_REGISTER, rows)
+        conn.commit()
+    except mysql.connector.Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+class App:
+    """Login and register pages sharing one root window.
+
+    Each page is built the first time it is shown and reused afterwards.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.root.geometry("300x250")
+        # One Font object shared by both page titles instead of a tuple parsed per widget
+        self.title_font = tkfont.Font(root=root, family="Arial", size=16, weight="bold")
+        self.login_frame = None
+        self.register_frame = None
+        self.current = None
+        # Finished worker results, drained on the Tk thread by _poll_results()
+        self.results = queue.Queue()
+        self.root.after(50, self._poll_results)
+
+    def _poll_results(self):
+        while True:
+            try:
+                handler, args = self.results.get_nowait()
+            except queue.Empty:
+                break
+            handler(*args)
+        self.root.after(50, self._poll_results)
+
+    def _show(self, frame, title):
+        if self.current is not None:
+            self.current.pack_forget()
+        self.root.title(title)
+        frame.pack(fill="both", expand=True)
+        self.current = frame
+
+    def show_login(self, status=""):
+        if self.login_frame is None:
+            self.login_frame = self._build_login()
+        self.pass_entry.delete(0, "end")
+        self.login_status.config(text=status, fg="green")
+        self._show(self.login_frame, "Login")
+
+    def show_register(self):
+        if self.register_frame is None:
+            self.register_frame = self._build_register()
+        self.new_user.delete(0, "end")
+        self.new_pass.delete(0, "end")
+        self.register_status.config(text="")
+        self._show(self.register_frame, "Register")
+
+    def _build_login(self):
+        frame = tk.Frame(self.root, bg="lightblue")
+
+        tk.Label(frame, text="Login", font=self.title_font, bg="lightblue").pack(pady=10)
+
+        tk.Label(frame, text="Username", bg="lightblue").pack()
+        self.user_entry = tk.Entry(frame, width=25)
+        self.user_entry.pack()
 
-    def open_register():
-        login_window.destroy()
-        register_page()
+        tk.Label(frame, text="Password", bg="lightblue").pack()
+        self.pass_entry = tk.Entry(frame, width=25, show="*")
+        self.pass_entry.pack()
 
-    tk.Button(login_window, text="Login", command=login, bg="green", fg="white", width=10).pack(pady=5)
-    tk.Button(login_window, text="Register", command=open_register, bg="blue", fg="white", width=10).pack()
-    tk.Button(login_window, text="Exit", command=login_window.destroy, bg="red", fg="white", width=10).pack(pady=5)
+        self.login_button = tk.Button(frame, text="Login", command=self.login, bg="green", fg="white", width=10)
+        self.login_button.pack(pady=5)
+        tk.Button(frame, text="Register", command=self.show_register, bg="blue", fg="white", width=10).pack()
+        tk.Button(frame, text="Exit", command=self.root.destroy, bg="red", fg="white", width=10).pack(pady=5)
 
-    login_window.mainloop()
+        # Routine results are shown here instead of in a modal dialog
+        self.login_status = tk.Label(frame, text="", bg="lightblue")
+        self.login_status.pack()
 
-def register_page():
-    global register_window
-    register_window = tk.Tk()
-    register_window.title("Register")
-    register_window.geometry("300x230")
-    register_window.config(bg="lightyellow")
+        return frame
 
-    tk.Label(register_window, text="Create Account", font=("Arial", 16, "bold"), bg="lightyellow").pack(pady=10)
+    def _build_register(self):
+        frame = tk.Frame(self.root, bg="lightyellow")
 
-    tk.Label(register_window, text="New Username", bg="lightyellow").pack()
-    new_user = tk.Entry(register_window, width=25)
-    new_user.pack()
+        tk.Label(frame, text="Create Account", font=self.title_font, bg="lightyellow").pack(pady=10)
 
-    tk.Label(register_window, text="New Password", bg="lightyellow").pack()
-    new_pass = tk.Entry(register_window, width=25, show="*")
-    new_pass.pack()
+        tk.Label(frame, text="New Username", bg="lightyellow").pack()
+        self.new_user = tk.Entry(frame, width=25)
+        self.new_user.pack()
 
-    def register():
-        username = new_user.get()
-        password = new_pass.get()
+        tk.Label(frame, text="New Password", bg="lightyellow").pack()
+        self.new_pass = tk.Entry(frame, width=25, show="*")
+        self.new_pass.pack()
 
+        self.register_button = tk.Button(frame, text="Register", command=self.register, bg="green", fg="white", width=10)
+        self.register_button.pack(pady=5)
+        tk.Button(frame, text="Back", command=self.show_login, bg="blue", fg="white", width=10).pack()
+        tk.Button(frame, text="Exit", command=self.root.destroy, bg="red", fg="white", width=10).pack(pady=5)
+
+        self.register_status = tk.Label(frame, text="", bg="lightyellow")
+        self.register_status.pack()
+
+        return frame
+
+    # Database work runs on a worker thread so the window keeps repainting.
+    # Workers make no Tk calls at all; they always put their result on self.results,
+    # passing any exception along, and the Tk thread picks it up in _poll_results().
+
+    def login(self):
+        username = self.user_entry.get().strip()
+        password = self.pass_entry.get()
+        if not valid_credentials(username, password):
+            self.login_status.config(text="Invalid Username or Password", fg="red")
+            return
+
+        self.login_button.config(state="disabled")
+        threading.Thread(target=self._do_login, args=(username, password), daemon=True).start()
+
+    def _do_login(self, username, password):
+        error = None
+        ok = False
         try:
-            cursor.execute("INSERT INTO accounts (username, password) VALUES (%s, %s)", (username, password))
-            db.commit()
-            messagebox.showinfo("Success", "Account Created!")
-            register_window.destroy()
-            login_page()
-        except:
-            messagebox.showerror("Error", "Username already exists!")
+            conn = get_pool().get_connection()
+            try:
+                # SQL_LOGIN has LIMIT 1, so fetchone() consumes the whole result before
+                # the connection goes back to the pool.
+                cursor = conn.cursor()
+                cursor.execute(SQL_LOGIN, (username,))
+                result = cursor.fetchone()
+            finally:
+                conn.close()
+            ok = result is not None and check_password(password, result[0])
+        except Exception as e:
+            error = e
+        finally:
+            # Always hand back, so the button is re-enabled whatever went wrong
+            self.results.put((self._on_login_result, (ok, error)))
 
-    def back():
-        register_window.destroy()
-        login_page()
+    def _on_login_result(self, ok, error):
+        self.login_button.config(state="normal")
+        if error is not None:
+            messagebox.showerror("Error", f"Could not log in: {error}")
+        elif ok:
+            self.login_status.config(text="Login Successful!", fg="green")
+        else:
+            self.login_status.config(text="Invalid Username or Password", fg="red")
+
+    def register(self):
+        username = self.new_user.get().strip()
+        password = self.new_pass.get()
+        if not valid_credentials(username, password):
+            self.register_status.config(text="Username and password are required", fg="red")
+            return
 
-    tk.Button(register_window, text="Register", command=register, bg="green", fg="white", width=10).pack(pady=5)
-    tk.Button(register_window, text="Back", command=back, bg="blue", fg="white", width=10).pack()
-    tk.Button(register_window, text="Exit", command=register_window.destroy, bg="red", fg="white", width=10).pack(pady=5)
+        self.register_button.config(state="disabled")
+        threading.Thread(target=self._do_register, args=(username, password), daemon=True).start()
 
-    register_window.mainloop()
+    def _do_register(self, username, password):
+        error = None
+        duplicate = False
+        try:
+            conn = get_pool().get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(SQL_REGISTER, (username, hash_password(password)))
+                conn.commit()
+            finally:
+                conn.close()
+        except mysql.connector.errors.IntegrityError as e:
+            # Only a duplicate key on accounts.username means the name is taken
+            if e.errno == errorcode.ER_DUP_ENTRY:
+                duplicate = True
+            else:
+                error = e
+        except Exception as e:
+            error = e
+        finally:
+            self.results.put((self._on_register_result, (duplicate, error)))
+
+    def _on_register_result(self, duplicate, error):
+        self.register_button.config(state="normal")
+        if duplicate:
+            self.register_status.config(text="Username already exists!", fg="red")
+        elif error is not None:
+            messagebox.showerror("Error", f"Could not create account: {error}")
+        else:
+            self.show_login("Account Created!")
 
 # Run login page
-login_page()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = App(root)
+    app.show_login()
+    root.mainloop()